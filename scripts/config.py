@@ -8,8 +8,9 @@ import os
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 # Add scripts directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -19,44 +20,101 @@ from installers.oh_my_zsh import OhMyZshInstaller
 from installers.claude_code import ClaudeCodeInstaller
 from installers.dotfiles import DotfilesInstaller
 from utils.logger import setup_logger
-from utils.system import SystemInfo
+from utils.system import SYSTEM
 
 
 class ConfigManager:
     """Main configuration manager for development environment setup."""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, log_file: Optional[str] = None):
         self.verbose = verbose
-        self.logger = setup_logger(verbose)
-        self.system_info = SystemInfo()
+        self.logger = setup_logger(verbose, log_file)
+        self.system_info = SYSTEM
         self.installers: Dict[str, BaseInstaller] = {}
         self._register_installers()
     
     def _register_installers(self):
         """Register all available installers."""
         self.installers = {
-            'oh-my-zsh': OhMyZshInstaller(self.logger),
-            'claude-code': ClaudeCodeInstaller(self.logger),
-            'dotfiles': DotfilesInstaller(self.logger),
+            'oh-my-zsh': OhMyZshInstaller(self.logger, self.system_info),
+            'claude-code': ClaudeCodeInstaller(self.logger, self.system_info),
+            'dotfiles': DotfilesInstaller(self.logger, self.system_info),
         }
+        
+        # Component -> components that must be installed before it
+        self.dependencies: Dict[str, List[str]] = {
+            'oh-my-zsh': [],
+            'claude-code': [],
+            'dotfiles': ['oh-my-zsh', 'claude-code'],
+        }
+        
+        # Dependencies never change after registration, so sort them once
+        self.install_layers = self._topo_sort(self.dependencies)
+        self.install_order: Tuple[str, ...] = tuple(
+            name for layer in self.install_layers for name in layer
+        )
+    
+    @staticmethod
+    def _topo_sort(dependencies: Dict[str, List[str]]) -> List[List[str]]:
+        """Group components into layers using Kahn's algorithm.
+        
+        Every component in a layer only depends on components from earlier
+        layers, so the components within a layer can be installed concurrently.
+        """
+        indegree = {name: len(deps) for name, deps in dependencies.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in dependencies}
+        for name, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        
+        layers = []
+        layer = [name for name, degree in indegree.items() if degree == 0]
+        while layer:
+            layers.append(layer)
+            next_layer = []
+            for name in layer:
+                for dependent in dependents[name]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        next_layer.append(dependent)
+            layer = next_layer
+        
+        if sum(len(layer) for layer in layers) != len(dependencies):
+            raise ValueError("Circular dependency between components")
+        
+        return layers
     
     def list_components(self):
         """List all available components for installation."""
         print("Available components:")
-        for name, installer in self.installers.items():
+        for name in self.install_order:
+            installer = self.installers[name]
             status = "✅" if installer.is_installed() else "❌"
             print(f"  {status} {name}: {installer.description}")
     
-    def install_component(self, component: str) -> bool:
-        """Install a specific component."""
+    def _supports_only(self, component: str, only: Optional[str]) -> bool:
+        """Check that --only is used with a component that supports it."""
+        if only is not None and not isinstance(self.installers[component], DotfilesInstaller):
+            self.logger.error(f"--only is not supported for {component}")
+            return False
+        return True
+    
+    def install_component(self, component: str, only: Optional[str] = None) -> bool:
+        """Install a specific component, or a single file of it with `only`."""
         if component not in self.installers:
             self.logger.error(f"Unknown component: {component}")
             return False
         
+        if not self._supports_only(component, only):
+            return False
+        
         installer = self.installers[component]
         self.logger.info(f"Installing {component}...")
         
         try:
+            if only is not None:
+                return installer.install(only)
+            
             if installer.is_installed():
                 self.logger.info(f"{component} is already installed")
                 return True
@@ -67,29 +125,41 @@ class ConfigManager:
             return False
     
     def install_all(self) -> bool:
-        """Install all components in the correct order."""
-        # Installation order matters due to dependencies
-        install_order = ['oh-my-zsh', 'claude-code', 'dotfiles']
-        
+        """Install all components, running independent ones in parallel."""
         success = True
-        for component in install_order:
-            if not self.install_component(component):
+        for layer in self.install_layers:
+            failed = []
+            with ThreadPoolExecutor(max_workers=len(layer)) as executor:
+                futures = {
+                    executor.submit(self.install_component, component): component
+                    for component in layer
+                }
+                for future in as_completed(futures):
+                    if not future.result():
+                        failed.append(futures[future])
+            
+            if failed:
                 success = False
-                if not self._confirm_continue(f"Failed to install {component}"):
+                if not self._confirm_continue(f"Failed to install {', '.join(failed)}"):
                     break
         
         return success
     
-    def update_component(self, component: str) -> bool:
-        """Update a specific component."""
+    def update_component(self, component: str, only: Optional[str] = None) -> bool:
+        """Update a specific component, or a single file of it with `only`."""
         if component not in self.installers:
             self.logger.error(f"Unknown component: {component}")
             return False
         
+        if not self._supports_only(component, only):
+            return False
+        
         installer = self.installers[component]
         self.logger.info(f"Updating {component}...")
         
         try:
+            if only is not None:
+                return installer.update(only)
             return installer.update()
         except Exception as e:
             self.logger.error(f"Failed to update {component}: {e}")
@@ -126,6 +196,11 @@ def main():
         action='store_true',
         help='Enable verbose output'
     )
+    parser.add_argument(
+        '--log-file',
+        metavar='PATH',
+        help='Also write the log to this file'
+    )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -139,10 +214,20 @@ def main():
         nargs='?',
         help='Component to install (or "all" for everything)'
     )
+    install_parser.add_argument(
+        '--only',
+        metavar='FILE',
+        help='Only deploy this dotfile, e.g. .zshrc (dotfiles component only)'
+    )
     
     # Update command
     update_parser = subparsers.add_parser('update', help='Update components')
     update_parser.add_argument('component', help='Component to update')
+    update_parser.add_argument(
+        '--only',
+        metavar='FILE',
+        help='Only update this dotfile, e.g. .zshrc (dotfiles component only)'
+    )
     
     # Uninstall command
     uninstall_parser = subparsers.add_parser('uninstall', help='Uninstall components')
@@ -154,7 +239,7 @@ def main():
         parser.print_help()
         return 1
     
-    manager = ConfigManager(verbose=args.verbose)
+    manager = ConfigManager(verbose=args.verbose, log_file=args.log_file)
     
     try:
         if args.command == 'list':
@@ -163,13 +248,15 @@ def main():
         
         elif args.command == 'install':
             if not args.component or args.component == 'all':
+                if args.only:
+                    parser.error("--only requires a single component")
                 success = manager.install_all()
             else:
-                success = manager.install_component(args.component)
+                success = manager.install_component(args.component, args.only)
             return 0 if success else 1
         
         elif args.command == 'update':
-            success = manager.update_component(args.component)
+            success = manager.update_component(args.component, args.only)
             return 0 if success else 1
         
         elif args.command == 'uninstall':
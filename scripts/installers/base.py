@@ -1,19 +1,25 @@
 """Base installer class for all component installers."""
 
 import os
+import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 import logging
 
 
 class BaseInstaller(ABC):
     """Abstract base class for all installers."""
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, system_info=None):
         self.logger = logger
+        # Shared SystemInfo whose probe results are cached for the whole run;
+        # None when the installer is used on its own
+        self.system_info = system_info
         self.home = Path.home()
+        # Results of command_exists lookups, valid until a command is installed
+        self._cmd_cache: Dict[str, bool] = {}
     
     @property
     @abstractmethod
@@ -41,20 +47,33 @@ class BaseInstaller(ABC):
         self.logger.warning(f"Uninstall not implemented for {self.__class__.__name__}")
         return False
     
-    def run_command(self, command: List[str], cwd: Optional[Path] = None, 
-                   shell: bool = False, check: bool = True) -> subprocess.CompletedProcess:
-        """Run a command and return the result."""
+    def run_command(self, command: Union[str, List[str]], cwd: Optional[Path] = None, 
+                   shell: bool = False, check: bool = True,
+                   capture: bool = True,
+                   stdin_text: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run a command and return the result.
+        
+        Pass capture=False when the caller does not read stdout; it is then
+        discarded instead of being decoded (unless debug logging is enabled).
+        stderr is always captured so failures keep their context. `stdin_text` is
+        written to the command's stdin. With shell=True, pass the command
+        line as a string.
+        """
         if shell and isinstance(command, list):
             command = ' '.join(command)
         
         self.logger.debug(f"Running command: {command}")
         
+        capture = capture or self.logger.isEnabledFor(logging.DEBUG)
+        
         try:
             result = subprocess.run(
                 command,
                 cwd=cwd,
                 shell=shell,
-                capture_output=True,
+                stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                input=stdin_text,
                 text=True,
                 check=check
             )
@@ -68,19 +87,25 @@ class BaseInstaller(ABC):
             
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Command failed: {e}")
-            self.logger.error(f"stdout: {e.stdout}")
-            self.logger.error(f"stderr: {e.stderr}")
+            # stdout is None when it was discarded with capture=False
+            if e.stdout:
+                self.logger.error(f"stdout: {e.stdout}")
+            if e.stderr:
+                self.logger.error(f"stderr: {e.stderr}")
             raise
     
     def download_file(self, url: str, destination: Path) -> bool:
         """Download a file using curl or wget."""
         destination.parent.mkdir(parents=True, exist_ok=True)
         
-        # Try curl first, then wget
-        for cmd in [['curl', '-fsSL', url, '-o', str(destination)],
-                   ['wget', '-q', url, '-O', str(destination)]]:
+        # Try curl first, then wget; a bounded connect timeout keeps an
+        # unreachable host from stalling the fallback
+        for cmd in [['curl', '-fsSL', '--connect-timeout', '10', url, '-o', str(destination)],
+                   ['wget', '-q', '--connect-timeout=10', url, '-O', str(destination)]]:
+            if not self.command_exists(cmd[0]):
+                continue
             try:
-                self.run_command(cmd)
+                self.run_command(cmd, capture=False)
                 return True
             except subprocess.CalledProcessError:
                 continue
@@ -97,9 +122,7 @@ class BaseInstaller(ABC):
         return path.is_dir()
     
     def command_exists(self, command: str) -> bool:
-        """Check if a command exists in PATH."""
-        try:
-            self.run_command(['which', command], check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
\ No newline at end of file
+        """Check if a command exists in PATH (cached per installer)."""
+        if command not in self._cmd_cache:
+            self._cmd_cache[command] = shutil.which(command) is not None
+        return self._cmd_cache[command]
\ No newline at end of file
@@ -2,15 +2,15 @@
 
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
 from .base import BaseInstaller
 
 
 class ClaudeCodeInstaller(BaseInstaller):
     """Installer for Claude Code with all dependencies and MCP plugins."""
     
-    def __init__(self, logger):
-        super().__init__(logger)
+    def __init__(self, logger, system_info=None):
+        super().__init__(logger, system_info)
         
         # MCP plugins to install based on custom-CLAUDE.md
         self.mcp_plugins = [
@@ -30,6 +30,11 @@ class ClaudeCodeInstaller(BaseInstaller):
                            '--', 'npx', '-y', 'spec-workflow-mcp@latest']
             }
         ]
+        
+        # Names reported by 'claude mcp list', invalidated after plugin installs
+        self._mcp_list_cache: Optional[Set[str]] = None
+        # Result of 'claude --version', invalidated when claude is (un)installed
+        self._claude_working: Optional[bool] = None
     
     @property
     def description(self) -> str:
@@ -40,12 +45,11 @@ class ClaudeCodeInstaller(BaseInstaller):
         return self.command_exists('claude') and self._check_claude_working()
     
     def _check_claude_working(self) -> bool:
-        """Check if Claude Code is properly configured."""
-        try:
-            result = self.run_command(['claude', '--version'], check=False)
-            return result.returncode == 0
-        except:
-            return False
+        """Check if Claude Code is properly configured (cached)."""
+        if self._claude_working is None:
+            result = self.run_command(['claude', '--version'], check=False, capture=False)
+            self._claude_working = result.returncode == 0
+        return self._claude_working
     
     def _check_prerequisites(self) -> List[str]:
         """Check prerequisites for Claude Code setup."""
@@ -104,16 +108,20 @@ class ClaudeCodeInstaller(BaseInstaller):
         """Install Claude Code CLI via NPM."""
         # Install Claude Code globally using system npm
         self.logger.info("Installing Claude Code via npm...")
-        self.run_command(['npm', 'install', '-g', '@anthropics/claude-code'])
+        self.run_command(['npm', 'install', '-g', '@anthropics/claude-code'], capture=False)
         
         # Verify installation
-        result = self.run_command(['claude', '--version'], check=False)
+        result = self.run_command(['claude', '--version'], check=False, capture=False)
         
         if result.returncode != 0:
             # Try alternative installation method
             self.logger.info("NPM installation failed, trying alternative installation via curl...")
             curl_install = 'curl -fsSL https://claude.ai/install.sh | sh'
-            self.run_command([curl_install], shell=True)
+            self.run_command(curl_install, shell=True, capture=False)
+        
+        # claude was just installed, so cached negative lookups are stale
+        self._cmd_cache.pop('claude', None)
+        self._claude_working = None
     
     def _install_mcp_plugins(self):
         """Install required MCP plugins for Claude Code."""
@@ -121,44 +129,54 @@ class ClaudeCodeInstaller(BaseInstaller):
             try:
                 self.logger.info(f"Installing MCP plugin: {plugin['name']}")
                 
-                # Run the plugin command directly
-                self.run_command(plugin['command'])
+                # Run the plugin command directly; 'claude mcp add' is cheaper
+                # than 'claude mcp list', which health-checks every server
+                result = self.run_command(plugin['command'], check=False, capture=False)
+                if result.returncode != 0:
+                    if 'already exists' in result.stderr:
+                        self.logger.info(f"MCP plugin {plugin['name']} already installed")
+                    else:
+                        self.logger.warning(f"Failed to install MCP plugin {plugin['name']}: "
+                                            f"{result.stderr.strip()}")
                 
             except Exception as e:
                 self.logger.warning(f"Failed to install MCP plugin {plugin['name']}: {e}")
                 # Don't fail the entire installation for MCP plugin failures
                 continue
+        
+        self._mcp_list_cache = None
+    
+    def _get_mcp_set(self) -> Set[str]:
+        """Return the names of registered MCP plugins (cached)."""
+        if self._mcp_list_cache is None:
+            names = set()
+            try:
+                result = self.run_command(['claude', 'mcp', 'list'], check=False)
+                if result.returncode == 0:
+                    # Entries look like "<name>: <command or url> - <health>"
+                    for line in result.stdout.splitlines():
+                        if ':' in line:
+                            names.add(line.split(':', 1)[0].strip())
+            except Exception:
+                # If claude mcp list cannot run, assume none are installed
+                pass
+            self._mcp_list_cache = names
+        
+        return self._mcp_list_cache
     
     def _check_mcp_status(self) -> Dict[str, bool]:
         """Check which MCP plugins are installed."""
-        status = {}
-        
-        try:
-            result = self.run_command(['claude', 'mcp', 'list'], check=False)
-            
-            if result.returncode == 0:
-                output = result.stdout
-                for plugin in self.mcp_plugins:
-                    status[plugin['name']] = plugin['name'] in output
-            else:
-                # If claude mcp list fails, assume none are installed
-                for plugin in self.mcp_plugins:
-                    status[plugin['name']] = False
-                    
-        except Exception:
-            for plugin in self.mcp_plugins:
-                status[plugin['name']] = False
-        
-        return status
+        installed = self._get_mcp_set()
+        return {plugin['name']: plugin['name'] in installed for plugin in self.mcp_plugins}
     
     def update(self) -> bool:
         """Update Claude Code and MCP plugins."""
         try:
             # Update Claude Code
             self.logger.info("Updating Claude Code...")
-            self.run_command(['npm', 'update', '-g', '@anthropics/claude-code'])
+            self.run_command(['npm', 'update', '-g', '@anthropics/claude-code'], capture=False)
             
-            # Reinstall MCP plugins to ensure they're up to date
+            # Register any MCP plugins that are still missing
             self._install_mcp_plugins()
             
             return True
@@ -172,7 +190,10 @@ class ClaudeCodeInstaller(BaseInstaller):
         try:
             # Uninstall Claude Code
             self.logger.info("Uninstalling Claude Code...")
-            self.run_command(['npm', 'uninstall', '-g', '@anthropics/claude-code'], check=False)
+            self.run_command(['npm', 'uninstall', '-g', '@anthropics/claude-code'],
+                             check=False, capture=False)
+            self._cmd_cache.pop('claude', None)
+            self._claude_working = None
             
             return True
             
@@ -185,19 +206,17 @@ class ClaudeCodeInstaller(BaseInstaller):
         self.logger.info("Claude Code Installation Status:")
         
         # Check Node.js
-        try:
-            result = self.run_command(['node', '--version'])
-            node_version = result.stdout.strip()
+        node_version = self._tool_version('node')
+        if node_version:
             self.logger.info(f"  Node.js: ✅ {node_version}")
-        except:
+        else:
             self.logger.info("  Node.js: ❌")
         
         # Check npm
-        try:
-            result = self.run_command(['npm', '--version'])
-            npm_version = result.stdout.strip()
+        npm_version = self._tool_version('npm')
+        if npm_version:
             self.logger.info(f"  npm: ✅ {npm_version}")
-        except:
+        else:
             self.logger.info("  npm: ❌")
         
         # Check Claude Code
@@ -209,4 +228,14 @@ class ClaudeCodeInstaller(BaseInstaller):
         self.logger.info("  MCP Plugins:")
         for plugin, installed in mcp_status.items():
             status = "✅" if installed else "❌"
-            self.logger.info(f"    {plugin}: {status}")
\ No newline at end of file
+            self.logger.info(f"    {plugin}: {status}")
+    
+    def _tool_version(self, tool: str) -> Optional[str]:
+        """Return the output of '<tool> --version', or None if unavailable."""
+        if not self.command_exists(tool):
+            return None
+        
+        result = self.run_command([tool, '--version'], check=False)
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
\ No newline at end of file
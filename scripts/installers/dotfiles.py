@@ -1,19 +1,24 @@
 """Dotfiles installer for deploying configuration files."""
 
+import difflib
+import filecmp
 import os
 import shutil
+import subprocess
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
 from .base import BaseInstaller
 
 
 class DotfilesInstaller(BaseInstaller):
     """Installer for deploying dotfiles and configuration files."""
     
-    def __init__(self, logger):
-        super().__init__(logger)
+    def __init__(self, logger, system_info=None):
+        super().__init__(logger, system_info)
         self.repo_root = Path(__file__).parent.parent.parent.resolve()
         self.configs_dir = self.repo_root / 'configs'
+        self._timestamp_fmt = '%Y%m%d_%H%M%S'
         
         # Configuration files mapping: source -> destination
         self.dotfiles_map = {
@@ -21,6 +26,18 @@ class DotfilesInstaller(BaseInstaller):
             '.gitconfig': self.home / '.gitconfig',
             'custom-CLAUDE.md': self.home / '.claude-custom.md',
         }
+        
+        # Source path for each dotfile, probed once instead of on every lookup
+        self._resolved_sources: Dict[str, Path] = {
+            name: self._get_source_path(name) for name in self.dotfiles_map
+        }
+        # Fully resolved sources for comparing against symlink targets. Only
+        # sources are resolved up front, as destinations change on install.
+        self._source_realpaths: Dict[str, Path] = {
+            name: path.resolve() for name, path in self._resolved_sources.items()
+        }
+        # Directories that must exist before symlinks can be created
+        self._dest_parents = {dest.parent for dest in self.dotfiles_map.values()}
     
     @property 
     def description(self) -> str:
@@ -42,7 +59,7 @@ class DotfilesInstaller(BaseInstaller):
     def is_installed(self) -> bool:
         """Check if dotfiles are deployed and up to date."""
         for src_name, dest_path in self.dotfiles_map.items():
-            src_path = self._get_source_path(src_name)
+            src_path = self._resolved_sources[src_name]
             
             if not src_path.exists():
                 continue  # Skip if source doesn't exist
@@ -50,24 +67,30 @@ class DotfilesInstaller(BaseInstaller):
             if not dest_path.exists():
                 return False  # Destination doesn't exist
             
-            # Skip if source and destination are the same file
-            if src_path.resolve() == dest_path.resolve():
-                continue
-            
-            # Check if it's a symlink pointing to the correct source
-            if dest_path.is_symlink():
-                try:
-                    if dest_path.resolve() != src_path.resolve():
-                        return False  # Symlink points to wrong target
-                except:
-                    return False  # Broken symlink
-            else:
-                return False  # Should be a symlink but isn't
+            # Either a symlink to the source or the source file itself; a
+            # symlink to anything else or a regular copy needs redeploying
+            if dest_path.resolve() != self._source_realpaths[src_name]:
+                return False
                 
         return True
     
-    def install(self) -> bool:
-        """Deploy dotfiles to home directory."""
+    def _select_dotfiles(self, only: Optional[str] = None) -> Optional[Dict[str, Path]]:
+        """Return the dotfiles to work on: all of them, or just `only`."""
+        if only is None:
+            return self.dotfiles_map
+        
+        if only not in self.dotfiles_map:
+            self.logger.error(f"File not found: {only}")
+            return None
+        
+        return {only: self.dotfiles_map[only]}
+    
+    def install(self, only: Optional[str] = None) -> bool:
+        """Deploy dotfiles to home directory, optionally just the `only` file."""
+        dotfiles = self._select_dotfiles(only)
+        if dotfiles is None:
+            return False
+        
         try:
             self.logger.info("Deploying dotfiles...")
             
@@ -75,8 +98,8 @@ class DotfilesInstaller(BaseInstaller):
             files_to_backup = []
             files_to_link = []
             
-            for src_name, dest_path in self.dotfiles_map.items():
-                src_path = self._get_source_path(src_name)
+            for src_name, dest_path in dotfiles.items():
+                src_path = self._resolved_sources[src_name]
                 
                 if not src_path.exists():
                     self.logger.warning(f"Source file not found: {src_path}")
@@ -85,7 +108,7 @@ class DotfilesInstaller(BaseInstaller):
                 # Check if symlink already points to correct target
                 if dest_path.is_symlink():
                     try:
-                        if dest_path.resolve() == src_path.resolve():
+                        if dest_path.resolve() == self._source_realpaths[src_name]:
                             self.logger.info(f"✅ {src_name} already correctly symlinked")
                             continue
                         else:
@@ -96,7 +119,7 @@ class DotfilesInstaller(BaseInstaller):
                         # Broken symlink - needs to be replaced
                         files_to_link.append((src_name, src_path, dest_path))
                 # Skip if source and destination are the same file (for backwards compatibility)
-                elif src_path.resolve() == dest_path.resolve():
+                elif dest_path.resolve() == self._source_realpaths[src_name]:
                     self.logger.info(f"✅ {src_name} source and destination are the same file (no action needed)")
                     continue
                 elif dest_path.exists():
@@ -111,14 +134,16 @@ class DotfilesInstaller(BaseInstaller):
             if files_to_backup:
                 self._create_selective_backups(files_to_backup)
             
+            # Create destination directories if needed
+            if files_to_link:
+                for parent in self._dest_parents:
+                    parent.mkdir(parents=True, exist_ok=True)
+            
             # Create symlinks
             for src_name, src_path, dest_path in files_to_link:
                 source_type = "personal" if "personal" in str(src_path) else "default"
                 self.logger.info(f"Deploying {src_name} ({source_type}) -> {dest_path}")
                 
-                # Create destination directory if needed
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                
                 # Remove existing file/link if it exists
                 if dest_path.exists() or dest_path.is_symlink():
                     dest_path.unlink()
@@ -128,7 +153,7 @@ class DotfilesInstaller(BaseInstaller):
                 self.logger.info(f"Created symlink: {dest_path} -> {src_path}")
             
             # Set proper permissions
-            self._set_permissions()
+            self._set_permissions(dotfiles)
             
             if files_to_link:
                 self.logger.info("Dotfiles deployment completed")
@@ -145,8 +170,7 @@ class DotfilesInstaller(BaseInstaller):
         backup_dir = self.home / '.config-backups'
         backup_dir.mkdir(exist_ok=True)
         
-        from datetime import datetime
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = datetime.now().strftime(self._timestamp_fmt)
         
         for src_name, dest_path in self.dotfiles_map.items():
             if dest_path.exists():
@@ -154,15 +178,15 @@ class DotfilesInstaller(BaseInstaller):
                 backup_path = backup_dir / backup_name
                 
                 self.logger.info(f"Backing up {dest_path} -> {backup_path}")
-                shutil.copy2(dest_path, backup_path)
+                shutil.copyfile(dest_path, backup_path)
+                shutil.copymode(dest_path, backup_path)
     
     def _create_selective_backups(self, files_to_backup):
         """Create backups only for specified files."""
         backup_dir = self.home / '.config-backups'
         backup_dir.mkdir(exist_ok=True)
         
-        from datetime import datetime
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = datetime.now().strftime(self._timestamp_fmt)
         
         for src_name, dest_path in files_to_backup:
             if dest_path.exists() or dest_path.is_symlink():
@@ -179,27 +203,32 @@ class DotfilesInstaller(BaseInstaller):
                         # If we can't resolve, just note it was a symlink
                         backup_path.write_text("Was a symlink (target unresolvable)\n")
                 else:
-                    shutil.copy2(dest_path, backup_path)
+                    shutil.copyfile(dest_path, backup_path)
+                    shutil.copymode(dest_path, backup_path)
     
-    def _set_permissions(self):
+    def _set_permissions(self, names: Optional[Iterable[str]] = None):
         """Set appropriate permissions for source files (symlinks inherit permissions)."""
+        if names is None:
+            names = self.dotfiles_map
+        
         # Set permissions on source files since symlinks inherit them
-        for src_name in self.dotfiles_map.keys():
-            src_path = self._get_source_path(src_name)
-            if src_path.exists():
-                if src_name == '.zshrc':
-                    src_path.chmod(0o644)  # .zshrc should be readable by others
-                else:
-                    src_path.chmod(0o600)  # Other config files private
+        for src_name in names:
+            src_path = self._resolved_sources[src_name]
+            # .zshrc should be readable by others, other config files private
+            mode = 0o644 if src_name == '.zshrc' else 0o600
+            try:
+                os.chmod(src_path, mode)
+            except FileNotFoundError:
+                pass  # Missing sources are reported by install()
     
-    def update(self) -> bool:
+    def update(self, only: Optional[str] = None) -> bool:
         """Update dotfiles (same as install)."""
-        return self.install()
+        return self.install(only)
     
     def uninstall(self) -> bool:
         """Remove deployed dotfiles and restore backups if available."""
         try:
-            backup_dir = self.home / '.config-backups'
+            backups = self._scan_backups()
             
             for src_name, dest_path in self.dotfiles_map.items():
                 if dest_path.exists():
@@ -207,11 +236,11 @@ class DotfilesInstaller(BaseInstaller):
                     dest_path.unlink()
                     
                     # Try to restore latest backup
-                    backups = list(backup_dir.glob(f"{dest_path.name}.backup_*"))
-                    if backups:
-                        latest_backup = max(backups, key=lambda p: p.stat().st_mtime)
-                        self.logger.info(f"Restoring backup {latest_backup} -> {dest_path}")
-                        shutil.copy2(latest_backup, dest_path)
+                    candidates = backups.get(dest_path.name)
+                    if candidates:
+                        latest_backup = max(candidates, key=lambda e: e.stat().st_mtime)
+                        self.logger.info(f"Restoring backup {latest_backup.path} -> {dest_path}")
+                        shutil.copy2(latest_backup.path, dest_path)
             
             return True
             
@@ -224,7 +253,7 @@ class DotfilesInstaller(BaseInstaller):
         self.logger.info("Dotfiles Status:")
         
         for src_name, dest_path in self.dotfiles_map.items():
-            src_path = self._get_source_path(src_name)
+            src_path = self._resolved_sources[src_name]
             
             if not src_path.exists():
                 self.logger.info(f"  {src_name}: ❌ Source not found")
@@ -239,10 +268,10 @@ class DotfilesInstaller(BaseInstaller):
             
             if dest_path.is_symlink():
                 try:
-                    if dest_path.resolve() == src_path.resolve():
+                    actual_target = dest_path.resolve()
+                    if actual_target == self._source_realpaths[src_name]:
                         self.logger.info(f"  {src_name}: ✅ Symlinked to {source_type} ({src_path})")
                     else:
-                        actual_target = dest_path.resolve()
                         self.logger.info(f"  {src_name}: ⚠️  Symlink points to wrong target: {actual_target}")
                 except:
                     self.logger.info(f"  {src_name}: ❌ Broken symlink")
@@ -250,49 +279,101 @@ class DotfilesInstaller(BaseInstaller):
                 self.logger.info(f"  {src_name}: ❌ Not a symlink (should be linked to {source_type})")
         
         # Show available backups
-        backup_dir = self.home / '.config-backups'
-        if backup_dir.exists():
-            backups = list(backup_dir.glob("*.backup_*"))
-            if backups:
-                self.logger.info(f"  Available backups: {len(backups)} files in {backup_dir}")
+        backup_count = sum(len(entries) for entries in self._scan_backups().values())
+        if backup_count:
+            backup_dir = self.home / '.config-backups'
+            self.logger.info(f"  Available backups: {backup_count} files in {backup_dir}")
     
-    def diff(self, filename: str = None):
-        """Show differences between source and deployed files."""
-        import difflib
+    def _scan_backups(self) -> Dict[str, List[os.DirEntry]]:
+        """Group backup files by the name of the dotfile they were taken from.
+        
+        Reads the backup directory once; backups are named
+        '<name>.backup_<timestamp>'.
+        """
+        backups: Dict[str, List[os.DirEntry]] = {}
+        try:
+            with os.scandir(self.home / '.config-backups') as entries:
+                for entry in entries:
+                    name, sep, _ = entry.name.rpartition('.backup_')
+                    if sep:
+                        backups.setdefault(name, []).append(entry)
+        except FileNotFoundError:
+            pass
         
-        files_to_check = self.dotfiles_map.items()
-        if filename:
-            # Filter to specific file
-            files_to_check = [(k, v) for k, v in self.dotfiles_map.items() if k == filename]
-            if not files_to_check:
-                self.logger.error(f"File not found: {filename}")
-                return
+        return backups
+    
+    def diff(self, only: Optional[str] = None):
+        """Show differences between source and deployed files."""
+        dotfiles = self._select_dotfiles(only)
+        if dotfiles is None:
+            return
         
-        for src_name, dest_path in files_to_check:
-            src_path = self.repo_root / src_name
+        for src_name, dest_path in dotfiles.items():
+            src_path = self._resolved_sources[src_name]
             
             if not src_path.exists() or not dest_path.exists():
                 continue
             
             try:
-                with open(src_path, 'r') as f:
-                    src_lines = f.readlines()
-                with open(dest_path, 'r') as f:
-                    dest_lines = f.readlines()
-                
-                diff = list(difflib.unified_diff(
-                    dest_lines, src_lines,
-                    fromfile=f"deployed/{src_name}",
-                    tofile=f"source/{src_name}",
-                    lineterm=""
-                ))
-                
-                if diff:
-                    self.logger.info(f"Differences in {src_name}:")
-                    for line in diff:
-                        print(line)
+                # Identical files (including the symlinked case) need no diff;
+                # filecmp checks sizes first and then compares in chunks
+                if (os.path.samefile(src_path, dest_path)
+                        or filecmp.cmp(src_path, dest_path, shallow=False)):
+                    differs = False
+                # The diff CLI is much faster than difflib on large files
+                elif shutil.which('diff'):
+                    differs = self._diff_with_cli(src_name, src_path, dest_path)
                 else:
+                    differs = self._diff_with_difflib(src_name, src_path, dest_path)
+                
+                if not differs:
                     self.logger.info(f"No differences in {src_name}")
                     
             except Exception as e:
-                self.logger.warning(f"Could not compare {src_name}: {e}")
\ No newline at end of file
+                self.logger.warning(f"Could not compare {src_name}: {e}")
+    
+    def _diff_with_cli(self, src_name: str, src_path: Path, dest_path: Path) -> bool:
+        """Stream a unified diff from the diff CLI. Returns True if files differ."""
+        command = [
+            'diff', '-u',
+            '--label', f"deployed/{src_name}",
+            '--label', f"source/{src_name}",
+            str(dest_path), str(src_path)
+        ]
+        
+        differs = False
+        with subprocess.Popen(command, stdout=subprocess.PIPE, text=True) as proc:
+            for line in proc.stdout:
+                if not differs:
+                    self.logger.info(f"Differences in {src_name}:")
+                    differs = True
+                print(line, end='')
+        
+        # diff exits with 0 (same), 1 (different) or 2 (trouble)
+        if proc.returncode > 1:
+            raise RuntimeError(f"diff exited with status {proc.returncode}")
+        
+        return differs
+    
+    def _diff_with_difflib(self, src_name: str, src_path: Path, dest_path: Path) -> bool:
+        """Print a unified diff using difflib. Returns True if files differ."""
+        with open(src_path, 'r') as f:
+            src_lines = f.readlines()
+        with open(dest_path, 'r') as f:
+            dest_lines = f.readlines()
+        
+        differs = False
+        for line in difflib.unified_diff(
+            dest_lines, src_lines,
+            fromfile=f"deployed/{src_name}",
+            tofile=f"source/{src_name}"
+        ):
+            if not differs:
+                self.logger.info(f"Differences in {src_name}:")
+                differs = True
+            print(line, end='')
+            if not line.endswith('\n'):
+                # Last line of a file without a trailing newline, as diff -u marks it
+                print('\n\\ No newline at end of file')
+        
+        return differs
\ No newline at end of file
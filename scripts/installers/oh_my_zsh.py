@@ -2,18 +2,33 @@
 
 import os
 import shutil
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 from .base import BaseInstaller
 
 
+# Command for installing the prerequisites with each supported package manager
+PREREQUISITE_INSTALL_COMMANDS = {
+    'apt-get': 'sudo apt-get install -y zsh git',
+    'dnf': 'sudo dnf install -y zsh git',
+    'yum': 'sudo yum install -y zsh git',
+    'pacman': 'sudo pacman -S --noconfirm zsh git',
+    'zypper': 'sudo zypper install -y zsh git',
+    'brew': 'brew install zsh git',
+}
+
+
 class OhMyZshInstaller(BaseInstaller):
     """Installer for Oh My Zsh and required plugins."""
     
-    def __init__(self, logger):
-        super().__init__(logger)
+    def __init__(self, logger, system_info=None):
+        super().__init__(logger, system_info)
         self.oh_my_zsh_dir = self.home / '.oh-my-zsh'
         self.plugins_dir = self.oh_my_zsh_dir / 'custom' / 'plugins'
+        # Set once plugins_dir is known to exist, reset when it is removed
+        self._plugins_dir_ensured = False
         
         # Required plugins based on .zshrc configuration
         self.required_plugins = [
@@ -33,7 +48,8 @@ class OhMyZshInstaller(BaseInstaller):
     
     def is_installed(self) -> bool:
         """Check if Oh My Zsh is installed."""
-        return self.oh_my_zsh_dir.exists() and (self.oh_my_zsh_dir / 'oh-my-zsh.sh').exists()
+        # The entry script can only exist inside an existing install directory
+        return (self.oh_my_zsh_dir / 'oh-my-zsh.sh').exists()
     
     def _check_prerequisites(self) -> List[str]:
         """Check prerequisites for Oh My Zsh setup."""
@@ -42,9 +58,6 @@ class OhMyZshInstaller(BaseInstaller):
         if not self.command_exists('zsh'):
             issues.append("zsh is not installed")
         
-        if not self.command_exists('curl') and not self.command_exists('wget'):
-            issues.append("Neither curl nor wget is available for downloading")
-        
         if not self.command_exists('git'):
             issues.append("git is not installed")
         
@@ -59,10 +72,7 @@ class OhMyZshInstaller(BaseInstaller):
                 self.logger.error("Prerequisites not met:")
                 for issue in issues:
                     self.logger.error(f"  - {issue}")
-                self.logger.info("Please install missing dependencies first:")
-                self.logger.info("  Ubuntu/Debian: sudo apt install zsh curl git")
-                self.logger.info("  CentOS/RHEL:   sudo yum install zsh curl git")
-                self.logger.info("  macOS:         brew install zsh curl git")
+                self._suggest_prerequisite_install()
                 return False
             
             # Install Oh My Zsh
@@ -86,45 +96,101 @@ class OhMyZshInstaller(BaseInstaller):
             return False
     
     
+    def _suggest_prerequisite_install(self):
+        """Show how to install the prerequisites with this system's package manager."""
+        self.logger.info("Please install missing dependencies first:")
+        
+        manager = self.system_info.get_package_manager() if self.system_info else None
+        if manager in PREREQUISITE_INSTALL_COMMANDS:
+            self.logger.info(f"  {PREREQUISITE_INSTALL_COMMANDS[manager]}")
+        else:
+            self.logger.info("  Ubuntu/Debian: sudo apt install zsh git")
+            self.logger.info("  CentOS/RHEL:   sudo yum install zsh git")
+            self.logger.info("  macOS:         brew install zsh git")
+    
     def _install_oh_my_zsh(self):
         """Install Oh My Zsh framework."""
         install_script_url = "https://raw.githubusercontent.com/ohmyzsh/ohmyzsh/master/tools/install.sh"
         
-        # Download and run the installer with non-interactive mode
-        cmd = f'sh -c "$(curl -fsSL {install_script_url})" "" --unattended'
-        self.run_command([cmd], shell=True)
+        # Download the installer in-process and feed it to sh on stdin,
+        # running it in non-interactive mode
+        with urllib.request.urlopen(install_script_url, timeout=30) as response:
+            script = response.read().decode('utf-8')
+        
+        self.run_command(['sh', '-s', '--', '--unattended'], stdin_text=script, capture=False)
         
         if not self.is_installed():
             raise Exception("Oh My Zsh installation failed")
     
     def _install_plugins(self):
         """Install required Oh My Zsh plugins."""
-        self.plugins_dir.mkdir(parents=True, exist_ok=True)
+        if not self.required_plugins:
+            return
         
-        for plugin in self.required_plugins:
-            plugin_path = self.plugins_dir / plugin['name']
-            
+        if not self._plugins_dir_ensured:
+            self.plugins_dir.mkdir(parents=True, exist_ok=True)
+            self._plugins_dir_ensured = True
+        
+        # Plugins are independent, network-bound git operations
+        failed = []
+        max_workers = min(8, len(self.required_plugins))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._clone_or_update, plugin): plugin['name']
+                for plugin in self.required_plugins
+            }
+            for future in as_completed(futures):
+                if not future.result():
+                    failed.append(futures[future])
+        
+        if failed:
+            raise Exception(f"Failed to install plugins: {', '.join(failed)}")
+    
+    def _clone_or_update(self, plugin: Dict[str, str]) -> bool:
+        """Clone a plugin, or update it if it is already installed."""
+        plugin_path = self.plugins_dir / plugin['name']
+        
+        try:
             if plugin_path.exists():
                 self.logger.info(f"Plugin {plugin['name']} already installed, updating...")
-                self.run_command(['git', 'pull'], cwd=plugin_path)
+                self._update_plugin(plugin_path)
             else:
                 self.logger.info(f"Installing plugin {plugin['name']}...")
+                # Plugins are sourced at runtime, so their history is not needed
                 self.run_command([
-                    'git', 'clone', plugin['url'], str(plugin_path)
-                ])
+                    'git', 'clone', '--depth=1', '--single-branch',
+                    plugin['url'], str(plugin_path)
+                ], capture=False)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to install plugin {plugin['name']}: {e}")
+            return False
+    
+    def _update_plugin(self, path: Path):
+        """Move a plugin clone to the remote tip, discarding local changes."""
+        # Fetch only the new tip so the clone stays shallow, then reset to
+        # exactly what was fetched
+        self.run_command(['git', '-C', str(path), 'fetch', '--depth=1', '--prune', 'origin'],
+                         capture=False)
+        self.run_command(['git', '-C', str(path), 'reset', '--hard', 'FETCH_HEAD'],
+                         capture=False)
     
     def _suggest_default_shell(self):
         """Suggest setting zsh as the default shell if it's not already."""
-        try:
-            # Check current shell
+        # Check current shell before touching the filesystem
+        if self.system_info:
+            current_shell = self.system_info.get_shell()
+        else:
             current_shell = os.environ.get('SHELL', '')
-            if 'zsh' in current_shell:
-                self.logger.info("zsh is already the default shell")
-                return
-            
+        if Path(current_shell).name == 'zsh':
+            self.logger.info("zsh is already the default shell")
+            return
+        
+        try:
             # Get zsh path
-            result = self.run_command(['which', 'zsh'])
-            zsh_path = result.stdout.strip()
+            zsh_path = shutil.which('zsh')
+            if zsh_path is None:
+                raise FileNotFoundError("zsh not found in PATH")
             
             self.logger.info("To set zsh as your default shell, run:")
             self.logger.info(f"  chsh -s {zsh_path}")
@@ -141,7 +207,7 @@ class OhMyZshInstaller(BaseInstaller):
             if self.is_installed():
                 self.logger.info("Updating Oh My Zsh...")
                 # Update Oh My Zsh itself
-                self.run_command(['git', 'pull'], cwd=self.oh_my_zsh_dir)
+                self.run_command(['git', 'pull'], cwd=self.oh_my_zsh_dir, capture=False)
                 
                 # Update plugins
                 self._install_plugins()
@@ -157,10 +223,11 @@ class OhMyZshInstaller(BaseInstaller):
             if self.oh_my_zsh_dir.exists():
                 self.logger.info("Removing Oh My Zsh directory...")
                 shutil.rmtree(self.oh_my_zsh_dir)
+                self._plugins_dir_ensured = False
             
             # Try to restore original shell
             try:
-                self.run_command(['chsh', '-s', '/bin/bash'])
+                self.run_command(['chsh', '-s', '/bin/bash'], capture=False)
             except:
                 pass
             
@@ -1,11 +1,66 @@
 """Logging utilities for the configuration manager."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that buffers records and flushes on warnings or above.
+    
+    FileHandler flushes after every record, which is one write syscall per
+    line on verbose runs. Lower-level records stay in a 64 KiB buffer until a
+    warning, a full buffer or close() writes them out.
+    """
+    
+    buffer_size = 64 * 1024
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding)
+    
+    def emit(self, record: logging.LogRecord):
+        self._defer_flush = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+    
+    def flush(self):
+        if not getattr(self, '_defer_flush', False):
+            super().flush()
+
+
+class SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once.
+    
+    Timestamps have one-second resolution, so every record logged within the
+    same second shares the string produced by a single strftime call.
+    """
+    
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        # (second, formatted) pair, replaced as a whole so threads never see
+        # a second paired with another second's string
+        self._last_time = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        # Without a datefmt the default format includes milliseconds
+        if datefmt is None or datefmt != self.datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, formatted = self._last_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._last_time = (second, formatted)
+        return formatted
+
+
 def setup_logger(verbose: bool = False, log_file: str = None) -> logging.Logger:
     """Set up logger with appropriate formatting and levels."""
     
@@ -14,10 +69,11 @@ def setup_logger(verbose: bool = False, log_file: str = None) -> logging.Logger:
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
     
     # Clear any existing handlers
+    _stop_queue_listener(logger)
     logger.handlers.clear()
     
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = SecondCachedFormatter(
         '%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -28,15 +84,21 @@ def setup_logger(verbose: bool = False, log_file: str = None) -> logging.Logger:
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
-    # File handler if log file is specified
-    if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_path)
+    # File handler if log file is specified. File writes happen on a listener
+    # thread so concurrent installers only enqueue records; the console stays
+    # synchronous to keep its output ordered with print() and input() prompts.
+    file_handler = _open_log_file(logger, log_file) if log_file else None
+    if file_handler:
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        logger.queue_listener = listener
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Prevent duplicate logs
     logger.propagate = False
@@ -44,6 +106,28 @@ def setup_logger(verbose: bool = False, log_file: str = None) -> logging.Logger:
     return logger
 
 
+def _open_log_file(logger: logging.Logger, log_file: str):
+    """Open the log file handler, or warn and return None if it can't be written."""
+    log_path = Path(log_file)
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        return BufferedFileHandler(log_path)
+    except OSError as e:
+        logger.warning(f"Cannot write log file {log_path}, logging to console only: {e}")
+        return None
+
+
+def _stop_queue_listener(logger: logging.Logger):
+    """Flush and stop the queue listener attached by setup_logger, if any."""
+    listener = getattr(logger, 'queue_listener', None)
+    if listener is not None:
+        listener.stop()
+        logger.queue_listener = None
+
+
+atexit.register(lambda: _stop_queue_listener(logging.getLogger('config_manager')))
+
+
 def get_default_log_path() -> Path:
     """Get default log file path."""
     home = Path.home()
@@ -2,18 +2,43 @@
 
 import os
 import platform
+import re
+import shlex
+import shutil
+import socket
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class SystemInfo:
     """System information gathering utility."""
     
     def __init__(self):
-        self.platform = platform.system().lower()
-        self.architecture = platform.machine()
-        self.python_version = platform.python_version()
+        # Probe results; the system does not change during a run
+        self._cache: Dict[str, Any] = {}
+    
+    def _cached(self, key: str, probe: Callable[[], Any]) -> Any:
+        """Return the cached result of a probe, running it on first use."""
+        if key not in self._cache:
+            self._cache[key] = probe()
+        return self._cache[key]
+    
+    def invalidate(self):
+        """Forget cached probe results so they are recomputed on next use."""
+        self._cache.clear()
+    
+    @property
+    def platform(self) -> str:
+        return self._cached('platform', lambda: platform.system().lower())
+    
+    @property
+    def architecture(self) -> str:
+        return self._cached('architecture', platform.machine)
+    
+    @property
+    def python_version(self) -> str:
+        return self._cached('python_version', platform.python_version)
     
     @property
     def is_linux(self) -> bool:
@@ -26,29 +51,37 @@ class SystemInfo:
     @property
     def is_wsl(self) -> bool:
         """Check if running in Windows Subsystem for Linux."""
+        return self._cached('is_wsl', self._detect_wsl)
+    
+    def _detect_wsl(self) -> bool:
         if not self.is_linux:
             return False
         
         try:
-            with open('/proc/version', 'r') as f:
-                version = f.read().lower()
-                return 'microsoft' in version or 'wsl' in version
+            # The kernel build string names Microsoft/WSL near the start
+            with open('/proc/version', 'rb') as f:
+                version = f.read(256).lower()
+                return b'microsoft' in version or b'wsl' in version
         except:
             return False
     
     def get_distribution(self) -> Optional[str]:
         """Get Linux distribution name."""
+        return self._cached('distribution', self._detect_distribution)
+    
+    def _detect_distribution(self) -> Optional[str]:
         if not self.is_linux:
             return None
         
         try:
-            # Try /etc/os-release first
-            with open('/etc/os-release', 'r') as f:
-                lines = f.readlines()
-                for line in lines:
-                    if line.startswith('ID='):
-                        return line.split('=')[1].strip().strip('"')
-        except:
+            # Try /etc/os-release first; values use shell quoting rules
+            text = Path('/etc/os-release').read_text()
+            match = re.search(r'^ID=(.*)$', text, re.MULTILINE)
+            if match:
+                value = shlex.split(match.group(1))
+                if value:
+                    return value[0].lower()
+        except (OSError, ValueError):
             pass
         
         # Try lsb_release command
@@ -64,6 +97,9 @@ class SystemInfo:
     
     def get_package_manager(self) -> Optional[str]:
         """Detect the system package manager."""
+        return self._cached('package_manager', self._detect_package_manager)
+    
+    def _detect_package_manager(self) -> Optional[str]:
         package_managers = {
             'apt-get': ['/usr/bin/apt-get', '/bin/apt-get'],
             'yum': ['/usr/bin/yum', '/bin/yum'],
@@ -121,38 +157,40 @@ class SystemInfo:
     
     def _has_internet(self) -> bool:
         """Check internet connectivity."""
-        test_hosts = ['8.8.8.8', '1.1.1.1']  # Google DNS and Cloudflare DNS
+        return self._cached('has_internet', self._probe_internet)
+    
+    def _probe_internet(self) -> bool:
+        # A TCP connect to public DNS resolvers needs no subprocess and, unlike
+        # ping, works in containers without CAP_NET_RAW
+        test_hosts = ['1.1.1.1', '8.8.8.8']  # Cloudflare DNS and Google DNS
         
         for host in test_hosts:
             try:
-                result = subprocess.run(
-                    ['ping', '-c', '1', '-W', '3', host],
-                    capture_output=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
+                with socket.create_connection((host, 53), timeout=2):
                     return True
-            except:
+            except OSError:
                 continue
         
         return False
     
     def _command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH."""
-        try:
-            subprocess.run(['which', command], 
-                         capture_output=True, check=True)
-            return True
-        except:
-            return False
+        return shutil.which(command) is not None
     
     def _has_sufficient_disk_space(self, min_space_gb: float = 1.0) -> bool:
         """Check if there's sufficient disk space."""
+        free_gb = self._cached('free_gb', self._probe_free_gb)
+        if free_gb is None:
+            return True  # Assume sufficient space if we can't check
+        return free_gb >= min_space_gb
+    
+    def _probe_free_gb(self) -> Optional[float]:
         try:
-            home_path = Path.home()
-            stat = os.statvfs(home_path)
-            free_bytes = stat.f_bavail * stat.f_frsize
-            free_gb = free_bytes / (1024 ** 3)
-            return free_gb >= min_space_gb
+            stat = os.statvfs(Path.home())
+            return stat.f_bavail * stat.f_frsize / (1024 ** 3)
         except:
-            return True  # Assume sufficient space if we can't check
\ No newline at end of file
+            return None
+
+
+# Shared instance so every consumer reuses the same cached probe results
+SYSTEM = SystemInfo()
\ No newline at end of file